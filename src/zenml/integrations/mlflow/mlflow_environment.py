@@ -76,9 +76,8 @@ class MLFlowEnvironment(BaseEnvironmentComponent):
         repo = Repository(root)
         artifact_store = repo.active_stack.artifact_store
         local_mlflow_backend_uri = os.path.join(artifact_store.path, "mlruns")
-        if not os.path.exists(local_mlflow_backend_uri):
-            os.makedirs(local_mlflow_backend_uri)
-            # TODO [medium]: safely access (possibly non-existent) artifact stores
+        os.makedirs(local_mlflow_backend_uri, exist_ok=True)
+        # TODO [medium]: safely access (possibly non-existent) artifact stores
         return "file:" + local_mlflow_backend_uri
 
     def activate(self) -> None:
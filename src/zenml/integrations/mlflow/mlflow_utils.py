@@ -11,28 +11,194 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
+import functools
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
 
 from mlflow import (  # type: ignore
     ActiveRun,
+    create_experiment,
     get_experiment_by_name,
-    search_runs,
+    get_tracking_uri,
     set_experiment,
     start_run,
 )
+from mlflow.entities import Experiment, LifecycleStage  # type: ignore
+from mlflow.exceptions import MlflowException  # type: ignore
+from mlflow.protos.databricks_pb2 import (  # type: ignore
+    RESOURCE_ALREADY_EXISTS,
+    ErrorCode,
+)
+from mlflow.tracking import MlflowClient  # type: ignore
 
 from zenml.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Process-local LRU cache of resolved MLflow run IDs, keyed by tracking URI,
+# experiment ID and run name
+_RUN_ID_CACHE: "OrderedDict[Tuple[str, str, str], str]" = OrderedDict()
+_RUN_ID_CACHE_MAX_SIZE = 128
+_RUN_ID_CACHE_LOCK = threading.Lock()
+
+# Process-local cache of resolved MLflow experiments, keyed by tracking URI
+# and experiment name
+_EXPERIMENT_CACHE: Dict[Tuple[str, str], Experiment] = {}
+_EXPERIMENT_CACHE_LOCK = threading.Lock()
+
+# Cache key of the experiment that was last set as the active MLflow
+# experiment by this module
+_ACTIVE_EXPERIMENT_KEY: Optional[Tuple[str, str]] = None
+
+
+def _get_cached_run_id(cache_key: Tuple[str, str, str]) -> Optional[str]:
+    """Returns the cached MLflow run ID for a cache key, if any.
+
+    Args:
+        cache_key: tracking URI, experiment ID and run name of the run.
+
+    Returns:
+        The cached run ID or `None` if no run ID is cached for the key.
+    """
+    with _RUN_ID_CACHE_LOCK:
+        run_id = _RUN_ID_CACHE.get(cache_key)
+        if run_id is not None:
+            _RUN_ID_CACHE.move_to_end(cache_key)
+        return run_id
+
+
+def _cache_run_id(cache_key: Tuple[str, str, str], run_id: str) -> None:
+    """Caches an MLflow run ID and evicts the least recently used entries
+    if the cache is full.
+
+    Args:
+        cache_key: tracking URI, experiment ID and run name of the run.
+        run_id: the MLflow run ID to cache.
+    """
+    with _RUN_ID_CACHE_LOCK:
+        _RUN_ID_CACHE[cache_key] = run_id
+        _RUN_ID_CACHE.move_to_end(cache_key)
+        while len(_RUN_ID_CACHE) > _RUN_ID_CACHE_MAX_SIZE:
+            _RUN_ID_CACHE.popitem(last=False)
+
+
+def _get_or_create_mlflow_experiment(experiment_name: str) -> Experiment:
+    """Get or create the MLflow experiment with the given name.
+
+    Resolved experiments are cached for the lifetime of the process. If
+    another process creates the experiment concurrently, the creation
+    conflict is caught and the existing experiment is fetched instead. The
+    experiment is also set as the active MLflow experiment, so runs started
+    without an explicit experiment (e.g. nested runs) are tracked under it.
+
+    Args:
+        experiment_name: the name of the MLflow experiment.
+
+    Returns:
+        The MLflow experiment with the specified name.
+
+    Raises:
+        MlflowException: If the experiment is deleted or could not be
+            created for any other reason than it already existing.
+        RuntimeError: If the experiment can't be found after creating it.
+    """
+    global _ACTIVE_EXPERIMENT_KEY
+
+    cache_key = (get_tracking_uri(), experiment_name)
+    with _EXPERIMENT_CACHE_LOCK:
+        experiment = _EXPERIMENT_CACHE.get(cache_key)
+        if experiment is None:
+            experiment = _fetch_or_create_mlflow_experiment(experiment_name)
+            _EXPERIMENT_CACHE[cache_key] = experiment
+        elif _ACTIVE_EXPERIMENT_KEY == cache_key:
+            return experiment
+
+        logger.debug(
+            "Setting the MLflow experiment name to %s", experiment_name
+        )
+        set_experiment(experiment_name)
+        _ACTIVE_EXPERIMENT_KEY = cache_key
+        return experiment
+
+
+def _fetch_or_create_mlflow_experiment(experiment_name: str) -> Experiment:
+    """Fetches the MLflow experiment with the given name from the tracking
+    server and creates it if it doesn't exist yet.
+
+    Args:
+        experiment_name: the name of the MLflow experiment.
+
+    Returns:
+        The MLflow experiment with the specified name.
+
+    Raises:
+        MlflowException: If the experiment is deleted or could not be
+            created for any other reason than it already existing.
+        RuntimeError: If the experiment can't be found after creating it.
+    """
+    experiment = get_experiment_by_name(experiment_name)
+    if experiment is None:
+        logger.debug("Creating MLflow experiment %s", experiment_name)
+        try:
+            create_experiment(experiment_name)
+        except MlflowException as e:
+            if e.error_code != ErrorCode.Name(RESOURCE_ALREADY_EXISTS):
+                raise
+            logger.debug(
+                "MLflow experiment %s was created concurrently, reusing it.",
+                experiment_name,
+            )
+        experiment = get_experiment_by_name(experiment_name)
+        if experiment is None:
+            raise RuntimeError(
+                f"Unable to find MLflow experiment {experiment_name} after "
+                f"creating it."
+            )
+
+    if experiment.lifecycle_stage == LifecycleStage.DELETED:
+        raise MlflowException(
+            f"MLflow experiment '{experiment_name}' is deleted. Restore it "
+            f"or permanently delete it before tracking runs under this name."
+        )
+    return experiment
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_run_name_filter(run_name: str) -> str:
+    """Builds an MLflow search filter string that matches runs by name.
+
+    The tag key is backtick-quoted so MLflow parses it as a single
+    identifier and the value is quoted with whichever quote character it
+    does not contain, as the MLflow filter syntax has no escape sequences.
+
+    Args:
+        run_name: the name of the MLflow run.
+
+    Returns:
+        The filter string to pass to the MLflow run search.
+
+    Raises:
+        ValueError: If the run name contains both single and double quotes,
+            as it can't be expressed in an MLflow filter string.
+    """
+    if '"' in run_name and "'" in run_name:
+        raise ValueError(
+            f"MLflow run name {run_name} contains both single and double "
+            f"quotes and can't be used to search for MLflow runs."
+        )
+    quote = "'" if '"' in run_name else '"'
+    return f"tags.`mlflow.runName` = {quote}{run_name}{quote}"
+
 
 def get_or_create_mlflow_run(experiment_name: str, run_name: str) -> ActiveRun:
     """Get or create an MLflow ActiveRun object for the given experiment and
     run name.
 
-    IMPORTANT: this function is not race condition proof. If two or more
-    processes call it at the same time and with the same arguments, it could
-    lead to a situation where two or more MLflow runs with the same name
-    and different IDs are created.
+    IMPORTANT: creating the MLflow run is not race condition proof. If two
+    or more processes call this function at the same time and with the same
+    arguments, it could lead to a situation where two or more MLflow runs
+    with the same name and different IDs are created.
 
     Args:
         experiment_name: the experiment name under which this runs will
@@ -45,23 +211,39 @@ def get_or_create_mlflow_run(experiment_name: str, run_name: str) -> ActiveRun:
     Returns:
         ActiveRun: an active MLflow run object with the specified name
     """
-    # Set which experiment is used within mlflow
-    logger.debug("Setting the MLflow experiment name to %s", experiment_name)
-    set_experiment(experiment_name)
-    mlflow_experiment = get_experiment_by_name(experiment_name)
+    mlflow_experiment = _get_or_create_mlflow_experiment(experiment_name)
+    experiment_id = mlflow_experiment.experiment_id
+
+    cache_key = (get_tracking_uri(), experiment_id, run_name)
+    cached_run_id = _get_cached_run_id(cache_key)
+    if cached_run_id is not None:
+        try:
+            return start_run(run_id=cached_run_id, experiment_id=experiment_id)
+        except MlflowException as e:
+            # the cached run might have been deleted in the meantime
+            logger.debug(
+                "Unable to resume cached MLflow run %s, searching for run %s "
+                "again: %s",
+                cached_run_id,
+                run_name,
+                e,
+            )
+            with _RUN_ID_CACHE_LOCK:
+                _RUN_ID_CACHE.pop(cache_key, None)
 
     # TODO [ENG-458]: find a solution to avoid race-conditions while creating
     #   the same MLflow run from parallel steps
-    runs = search_runs(
-        experiment_ids=[mlflow_experiment.experiment_id],
-        filter_string=f'tags.mlflow.runName = "{run_name}"',
-        output_format="list",
+    runs = MlflowClient().search_runs(
+        experiment_ids=[experiment_id],
+        filter_string=_get_run_name_filter(run_name),
+        max_results=1,
     )
     if runs:
-        run_id = runs[0].info.run_id
-        return start_run(
-            run_id=run_id, experiment_id=mlflow_experiment.experiment_id
+        active_run = start_run(
+            run_id=runs[0].info.run_id, experiment_id=experiment_id
         )
-    return start_run(
-        run_name=run_name, experiment_id=mlflow_experiment.experiment_id
-    )
+    else:
+        active_run = start_run(run_name=run_name, experiment_id=experiment_id)
+
+    _cache_run_id(cache_key, active_run.info.run_id)
+    return active_run
@@ -0,0 +1,230 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+from unittest.mock import MagicMock
+
+import mlflow
+import pytest
+from mlflow.entities import LifecycleStage
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import (
+    INVALID_PARAMETER_VALUE,
+    RESOURCE_ALREADY_EXISTS,
+)
+
+from zenml.integrations.mlflow import mlflow_utils
+from zenml.integrations.mlflow.mlflow_utils import (
+    _cache_run_id,
+    _get_cached_run_id,
+    _get_or_create_mlflow_experiment,
+    _get_run_name_filter,
+    get_or_create_mlflow_run,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_mlflow_caches(mocker):
+    """Fixture that empties the process-local MLflow caches for each test."""
+    mocker.patch.dict(mlflow_utils._RUN_ID_CACHE, clear=True)
+    mocker.patch.dict(mlflow_utils._EXPERIMENT_CACHE, clear=True)
+    mocker.patch.object(mlflow_utils, "_ACTIVE_EXPERIMENT_KEY", None)
+
+
+@pytest.fixture
+def local_mlflow_tracking_uri(tmp_path):
+    """Fixture that points MLflow to a file store in a temporary directory."""
+    mlflow.set_tracking_uri(f"file:{tmp_path}")
+    yield
+    while mlflow.active_run():
+        mlflow.end_run()
+    mlflow.set_tracking_uri("")
+
+
+def test_get_or_create_mlflow_experiment_caches_experiment(mocker):
+    """Tests that an existing experiment is only fetched once."""
+    experiment = MagicMock(experiment_id="1")
+    mock_get_experiment = mocker.patch.object(
+        mlflow_utils, "get_experiment_by_name", return_value=experiment
+    )
+    mock_create_experiment = mocker.patch.object(
+        mlflow_utils, "create_experiment"
+    )
+    mock_set_experiment = mocker.patch.object(mlflow_utils, "set_experiment")
+
+    assert _get_or_create_mlflow_experiment("experiment") is experiment
+    assert _get_or_create_mlflow_experiment("experiment") is experiment
+
+    mock_get_experiment.assert_called_once_with("experiment")
+    mock_create_experiment.assert_not_called()
+    mock_set_experiment.assert_called_once_with("experiment")
+
+
+def test_get_or_create_mlflow_experiment_handles_conflicts(mocker):
+    """Tests that an experiment created concurrently by another process is
+    fetched instead of failing."""
+    experiment = MagicMock(experiment_id="1")
+    mocker.patch.object(
+        mlflow_utils, "get_experiment_by_name", side_effect=[None, experiment]
+    )
+    mocker.patch.object(
+        mlflow_utils,
+        "create_experiment",
+        side_effect=MlflowException(
+            "Experiment already exists.",
+            error_code=RESOURCE_ALREADY_EXISTS,
+        ),
+    )
+    mocker.patch.object(mlflow_utils, "set_experiment")
+
+    assert _get_or_create_mlflow_experiment("experiment") is experiment
+
+
+def test_get_or_create_mlflow_experiment_reraises_creation_errors(mocker):
+    """Tests that experiment creation errors other than a conflict are raised
+    and that nothing gets cached."""
+    mocker.patch.object(
+        mlflow_utils, "get_experiment_by_name", return_value=None
+    )
+    mocker.patch.object(
+        mlflow_utils,
+        "create_experiment",
+        side_effect=MlflowException(
+            "Invalid experiment name.",
+            error_code=INVALID_PARAMETER_VALUE,
+        ),
+    )
+
+    with pytest.raises(MlflowException):
+        _get_or_create_mlflow_experiment("experiment")
+
+    assert not mlflow_utils._EXPERIMENT_CACHE
+
+
+def test_get_or_create_mlflow_experiment_fails_for_deleted_experiments(
+    mocker,
+):
+    """Tests that deleted experiments are rejected and not cached."""
+    experiment = MagicMock(
+        experiment_id="1", lifecycle_stage=LifecycleStage.DELETED
+    )
+    mocker.patch.object(
+        mlflow_utils, "get_experiment_by_name", return_value=experiment
+    )
+    mock_set_experiment = mocker.patch.object(mlflow_utils, "set_experiment")
+
+    with pytest.raises(MlflowException):
+        _get_or_create_mlflow_experiment("experiment")
+
+    assert not mlflow_utils._EXPERIMENT_CACHE
+    mock_set_experiment.assert_not_called()
+
+
+def test_nested_runs_inherit_the_mlflow_run_experiment(
+    local_mlflow_tracking_uri,
+):
+    """Tests that runs started inside the MLflow run of a step are tracked
+    under the same experiment."""
+    with get_or_create_mlflow_run(
+        experiment_name="experiment", run_name="run"
+    ) as parent_run:
+        with mlflow.start_run(nested=True) as child_run:
+            assert child_run.info.experiment_id == parent_run.info.experiment_id
+
+
+def test_run_name_filter_quotes_run_names():
+    """Tests that the run name filter picks a quote character that isn't
+    part of the run name."""
+    assert _get_run_name_filter("run") == 'tags.`mlflow.runName` = "run"'
+    assert _get_run_name_filter('my"run') == "tags.`mlflow.runName` = 'my\"run'"
+    assert _get_run_name_filter("my'run") == 'tags.`mlflow.runName` = "my\'run"'
+
+
+def test_run_name_filter_fails_for_run_names_with_both_quotes():
+    """Tests that run names containing both quote characters are rejected."""
+    with pytest.raises(ValueError):
+        _get_run_name_filter("my'\"run")
+
+
+def _mock_run(run_id: str) -> MagicMock:
+    """Returns a mock MLflow run with the given ID."""
+    run = MagicMock()
+    run.info.run_id = run_id
+    return run
+
+
+def test_get_or_create_mlflow_run_reuses_cached_run_id(mocker):
+    """Tests that a resolved run ID is reused without searching again."""
+    experiment = MagicMock(experiment_id="1")
+    mocker.patch.object(
+        mlflow_utils,
+        "_get_or_create_mlflow_experiment",
+        return_value=experiment,
+    )
+    mock_client = mocker.patch.object(mlflow_utils, "MlflowClient")
+    mock_client.return_value.search_runs.return_value = [_mock_run("run_id")]
+    mock_start_run = mocker.patch.object(
+        mlflow_utils, "start_run", return_value=_mock_run("run_id")
+    )
+
+    get_or_create_mlflow_run(experiment_name="experiment", run_name="run")
+    get_or_create_mlflow_run(experiment_name="experiment", run_name="run")
+
+    mock_client.return_value.search_runs.assert_called_once()
+    assert mock_start_run.call_count == 2
+    mock_start_run.assert_called_with(run_id="run_id", experiment_id="1")
+
+
+def test_get_or_create_mlflow_run_recovers_from_deleted_cached_run(mocker):
+    """Tests that a cached run which can't be resumed anymore is evicted and
+    a new run is created."""
+    experiment = MagicMock(experiment_id="1")
+    mocker.patch.object(
+        mlflow_utils,
+        "_get_or_create_mlflow_experiment",
+        return_value=experiment,
+    )
+    mock_client = mocker.patch.object(mlflow_utils, "MlflowClient")
+    mock_client.return_value.search_runs.return_value = []
+    mocker.patch.object(
+        mlflow_utils,
+        "start_run",
+        side_effect=[
+            MlflowException("Cannot start run in the deleted state."),
+            _mock_run("new_run_id"),
+        ],
+    )
+    cache_key = (mlflow_utils.get_tracking_uri(), "1", "run")
+    mlflow_utils._RUN_ID_CACHE[cache_key] = "deleted_run_id"
+
+    active_run = get_or_create_mlflow_run(
+        experiment_name="experiment", run_name="run"
+    )
+
+    assert active_run.info.run_id == "new_run_id"
+    assert mlflow_utils._RUN_ID_CACHE[cache_key] == "new_run_id"
+    mock_client.return_value.search_runs.assert_called_once()
+
+
+def test_run_id_cache_evicts_least_recently_used_entries(mocker):
+    """Tests that the run ID cache doesn't grow beyond its maximum size."""
+    mocker.patch.object(mlflow_utils, "_RUN_ID_CACHE_MAX_SIZE", 2)
+
+    _cache_run_id(("uri", "1", "run_1"), "run_id_1")
+    _cache_run_id(("uri", "1", "run_2"), "run_id_2")
+    assert _get_cached_run_id(("uri", "1", "run_1")) == "run_id_1"
+    _cache_run_id(("uri", "1", "run_3"), "run_id_3")
+
+    assert len(mlflow_utils._RUN_ID_CACHE) == 2
+    assert _get_cached_run_id(("uri", "1", "run_1")) == "run_id_1"
+    assert _get_cached_run_id(("uri", "1", "run_2")) is None
+    assert _get_cached_run_id(("uri", "1", "run_3")) == "run_id_3"
@@ -17,28 +17,33 @@ import pytest
 from zenml.enums import MetadataStoreFlavor, StackComponentType
 from zenml.metadata_stores import SQLiteMetadataStore
 
+REMOTE_URIS = ["gs://remote/uri", "s3://remote/uri", "hdfs://remote/uri"]
 
-def test_sqlite_metadata_store_attributes():
+
+@pytest.fixture(scope="module")
+def sqlite_metadata_store() -> SQLiteMetadataStore:
+    """Fixture that returns a sqlite metadata store with a local uri."""
+    return SQLiteMetadataStore(name="", uri="/local/uri")
+
+
+def test_sqlite_metadata_store_attributes(sqlite_metadata_store):
     """Tests that the basic attributes of the sqlite metadata store are set
     correctly."""
-    metadata_store = SQLiteMetadataStore(name="", uri="")
-    assert metadata_store.supports_local_execution is True
-    assert metadata_store.supports_remote_execution is False
-    assert metadata_store.type == StackComponentType.METADATA_STORE
-    assert metadata_store.flavor == MetadataStoreFlavor.SQLITE
+    assert sqlite_metadata_store.supports_local_execution is True
+    assert sqlite_metadata_store.supports_remote_execution is False
+    assert sqlite_metadata_store.type == StackComponentType.METADATA_STORE
+    assert sqlite_metadata_store.flavor == MetadataStoreFlavor.SQLITE
 
 
-def test_sqlite_metadata_store_only_supports_local_uris():
-    """Checks that a sqlite metadata store can only be initialized with a local
+@pytest.mark.parametrize("remote_uri", REMOTE_URIS)
+def test_sqlite_metadata_store_fails_with_remote_uris(remote_uri):
+    """Checks that a sqlite metadata store can't be initialized with a remote
     uri."""
     with pytest.raises(pydantic.ValidationError):
-        SQLiteMetadataStore(name="", uri="gs://remote/uri")
+        SQLiteMetadataStore(name="", uri=remote_uri)
 
-    with pytest.raises(pydantic.ValidationError):
-        SQLiteMetadataStore(name="", uri="s3://remote/uri")
 
-    with pytest.raises(pydantic.ValidationError):
-        SQLiteMetadataStore(name="", uri="hdfs://remote/uri")
-
-    metadata_store = SQLiteMetadataStore(name="", uri="/local/uri")
-    assert metadata_store.uri == "/local/uri"
+def test_sqlite_metadata_store_supports_local_uris(sqlite_metadata_store):
+    """Checks that a sqlite metadata store can be initialized with a local
+    uri."""
+    assert sqlite_metadata_store.uri == "/local/uri"